@@ -23,10 +23,12 @@ echo "Starting log generator..."
 echo "Writing logs to: $LOG_FILE"
 echo "Press [Ctrl+C] to stop."
 
-while true; do
-    TIMESTAMP=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
+exec 3>>"$LOG_FILE"
 
-    RAND_SEED=$(date +%N)
+while true; do
+    set -- $(date -u +"%Y-%m-%dT%H:%M:%SZ %N")
+    TIMESTAMP=$1
+    RAND_SEED=$2
 
     case $((RAND_SEED % 6)) in
         0|1|2) LOG_LEVEL="INFO";;
@@ -49,7 +51,7 @@ while true; do
 
     LOG_LINE="$TIMESTAMP [$LOG_LEVEL] - chrome_process[$$]: $MESSAGE"
 
-    echo "$LOG_LINE" >> "$LOG_FILE"
+    echo "$LOG_LINE" >&3
     echo "   Appended: $LOG_LINE"
 
     sleep $((RAND_SEED % 5 + 1))